@@ -0,0 +1,85 @@
+import heapq
+import random
+from collections import Counter
+
+
+class DistractorIndex:
+    """Precomputed nearest neighbours of answers, used as multiple-choice distractors."""
+
+    NGRAM_SIZE = 3
+    # N-grams shared by more answers than this (e.g. " to" in "to be", "to go")
+    # say little about similarity and are not used to find candidates, which
+    # keeps building the table near-linear in the number of answers
+    MAX_NGRAM_POSTINGS = 100
+
+    def __init__(self, answers, neighbours=3):
+        """
+        Build the neighbour table for a collection of answers.
+
+        Args:
+            answers (iterable): Possible answers, e.g. all translations of a lesson.
+            neighbours (int): Number of distractors to keep per answer.
+        """
+        self.answers = list(dict.fromkeys(answers))
+        self.neighbours = neighbours
+        self.table = self.build_table()
+
+    @classmethod
+    def ngrams(cls, text):
+        """Return the set of padded character n-grams of text."""
+        padded = f" {text.casefold()} "
+        if len(padded) <= cls.NGRAM_SIZE:
+            return {padded}
+        return {
+            padded[i : i + cls.NGRAM_SIZE]
+            for i in range(len(padded) - cls.NGRAM_SIZE + 1)
+        }
+
+    def build_table(self):
+        """Map every answer to its most similar other answers (Dice coefficient)."""
+        profiles = [self.ngrams(answer) for answer in self.answers]
+
+        postings = {}
+        for idx, grams in enumerate(profiles):
+            for gram in grams:
+                postings.setdefault(gram, []).append(idx)
+
+        postings = {
+            gram: answers
+            for gram, answers in postings.items()
+            if len(answers) <= self.MAX_NGRAM_POSTINGS
+        }
+
+        table = {}
+        for idx, grams in enumerate(profiles):
+            # Only answers sharing at least one informative n-gram are scored
+            shared = Counter()
+            for gram in grams:
+                shared.update(postings.get(gram, ()))
+            del shared[idx]
+
+            best = heapq.nlargest(
+                self.neighbours,
+                shared.items(),
+                key=lambda item: 2 * item[1] / (len(grams) + len(profiles[item[0]])),
+            )
+            similar = [self.answers[other] for other, _ in best]
+
+            # Pad with unrelated answers when too few similar ones exist
+            available = len(self.answers) - 1 - len(shared)
+            needed = min(self.neighbours - len(similar), available)
+            picked = set()
+            while len(picked) < needed:
+                other = random.randrange(len(self.answers))
+                if other != idx and other not in shared:
+                    picked.add(other)
+            similar += [self.answers[other] for other in picked]
+
+            table[self.answers[idx]] = similar
+        return table
+
+    def choices(self, answer):
+        """Return the answer and its distractors in random order."""
+        options = [answer] + self.table.get(answer, [])
+        random.shuffle(options)
+        return options
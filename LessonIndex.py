@@ -0,0 +1,160 @@
+import bisect
+import os
+import re
+import unicodedata
+from constants import LESSONS_DIR
+from Lesson import Lesson
+
+
+class LessonIndex:
+    """Inverted index over the words, translations and usages of all lessons."""
+
+    FIELDS = ("word", "translation", "usage")
+
+    # Letters that NFKD does not decompose into a base letter + diacritic
+    FOLD_MAP = str.maketrans(
+        {"æ": "ae", "ø": "o", "œ": "oe", "ß": "ss", "ł": "l", "đ": "d"}
+    )
+
+    TOKEN_PATTERN = re.compile(r"\w+")
+
+    def __init__(self, lessons_dir=LESSONS_DIR):
+        self.lessons_dir = lessons_dir
+        self.postings = {}  # token -> {(file_path, word, field)}
+        self.documents = {}  # file_path -> lesson data
+        self.mtimes = {}  # file_path -> mtime at indexing time
+        self._sorted_tokens = []
+        self._tokens_dirty = False
+
+    @classmethod
+    def fold(cls, text):
+        """Lowercase text and strip diacritics, e.g. 'Været' -> 'vaeret'."""
+        text = text.casefold().translate(cls.FOLD_MAP)
+        return "".join(
+            char
+            for char in unicodedata.normalize("NFKD", text)
+            if not unicodedata.combining(char)
+        )
+
+    @classmethod
+    def tokenize(cls, text):
+        return cls.TOKEN_PATTERN.findall(cls.fold(text))
+
+    def _entry_fields(self, word, data):
+        yield "word", word
+        yield "translation", data["translation"]
+        yield "usage", data["usage"]
+
+    def _add_file(self, file_path):
+        data = Lesson(file_path).data
+        self.documents[file_path] = data
+        for word, entry in data.items():
+            for field, text in self._entry_fields(word, entry):
+                for token in self.tokenize(text):
+                    if token not in self.postings:
+                        self.postings[token] = set()
+                        self._tokens_dirty = True
+                    self.postings[token].add((file_path, word, field))
+
+    def _remove_file(self, file_path):
+        data = self.documents.pop(file_path, {})
+        for word, entry in data.items():
+            for field, text in self._entry_fields(word, entry):
+                for token in self.tokenize(text):
+                    postings = self.postings.get(token)
+                    if postings is None:
+                        continue
+                    postings.discard((file_path, word, field))
+                    if not postings:
+                        del self.postings[token]
+                        self._tokens_dirty = True
+        self.mtimes.pop(file_path, None)
+
+    def refresh(self):
+        """
+        Bring the index up to date with the lesson files on disk.
+
+        Only files that were added, modified or deleted since the last refresh
+        are re-indexed.
+
+        Returns:
+            int: The number of files that were (re)indexed or removed.
+        """
+        current = {}
+        for root, _, files in os.walk(self.lessons_dir):
+            for file in files:
+                if file.endswith(".csv"):
+                    file_path = os.path.join(root, file)
+                    try:
+                        current[file_path] = os.path.getmtime(file_path)
+                    except OSError:
+                        continue
+
+        changed = 0
+        for file_path in list(self.mtimes):
+            if file_path not in current:
+                self._remove_file(file_path)
+                changed += 1
+
+        for file_path, mtime in current.items():
+            if self.mtimes.get(file_path) == mtime:
+                continue
+            self._remove_file(file_path)
+            self._add_file(file_path)
+            self.mtimes[file_path] = mtime
+            changed += 1
+
+        return changed
+
+    def _tokens_with_prefix(self, prefix):
+        if self._tokens_dirty:
+            self._sorted_tokens = sorted(self.postings)
+            self._tokens_dirty = False
+        start = bisect.bisect_left(self._sorted_tokens, prefix)
+        for token in self._sorted_tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            yield token
+
+    def _match(self, token, prefix):
+        if not prefix:
+            return set(self.postings.get(token, ()))
+        matches = set()
+        for candidate in self._tokens_with_prefix(token):
+            matches |= self.postings[candidate]
+        return matches
+
+    def search(self, query, fields=None, prefix=True):
+        """
+        Find lesson fields containing every token of the query.
+
+        Args:
+            query (str): Words to look for; diacritics and case are ignored.
+            fields (iterable, optional): Restrict matches to these of FIELDS.
+            prefix (bool): Match query tokens as prefixes of indexed tokens.
+
+        Returns:
+            list: Sorted (file_path, word, field) tuples.
+        """
+        tokens = self.tokenize(query)
+        if not tokens:
+            return []
+
+        # Intersect the rarest postings first to keep the working set small
+        candidates = sorted(
+            (self._match(token, prefix) for token in set(tokens)), key=len
+        )
+        results = candidates[0]
+        for postings in candidates[1:]:
+            if not results:
+                break
+            results &= postings
+
+        if fields is not None:
+            fields = set(fields)
+            results = {match for match in results if match[2] in fields}
+        return sorted(results)
+
+    def entry(self, file_path, word):
+        """Return the indexed data of a word, as loaded by Lesson."""
+        return self.documents[file_path][word]
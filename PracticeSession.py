@@ -1,6 +1,10 @@
 import random
-from constants import CYCLE_PROMPTS, LANG_NAME_MAP
+from collections import deque
+from itertools import islice
+from string import ascii_lowercase
+from constants import CHOICE_OPTIONS, CYCLE_PROMPTS, LANG_NAME_MAP
 from AudioPlayer import AudioPlayer
+from DistractorIndex import DistractorIndex
 
 
 class PracticeSession:
@@ -20,6 +24,8 @@ class PracticeSession:
         self.language = language
         self.target_progress = target_progress
         self.audio = AudioPlayer(language)
+        self._distractors = None
+        self.choice_options = []  # Options of the current multiple-choice prompt
 
     @property
     def target_progress(self):
@@ -45,68 +51,67 @@ class PracticeSession:
             if input("[PRESS ENTER] >>") in self.EXIT_COMMANDS:
                 break
 
+    def words_to_practice(self):
+        """Lazily yield the words whose progress is below the target progress."""
+        for word, data in self.lesson.data.items():
+            if data["progress"] < self.target_progress:
+                yield word
+
     def practice_lesson(self, mode_func):
         """
         Practice the lesson using the specified prompting mode.
 
+        Words are taken in windows of up to CYCLE_PROMPTS, so only the current
+        window is held in memory and every prompt costs O(1) bookkeeping.
+
         Args:
             mode_func (callable): The general_prompt function with a specific prompting mode.
         """
         while True:
-            # Initialize cycle status: Track if each word has been answered correctly in the current cycle
-            cycle_status = {
-                word: False
-                for word in self.lesson.data
-                if self.lesson.data[word]["progress"] < self.target_progress
-            }
-
-            if not cycle_status:
+            # Words are only modified while prompted, so lazily selecting the
+            # next window yields the same words as selecting them all up front
+            words = self.words_to_practice()
+            window = list(islice(words, CYCLE_PROMPTS))
+
+            if not window:
                 print("No words to practice")
                 break
 
-            # Save the initial progress for comparison later
-            initial_progress = {
-                word: self.lesson.data[word]["progress"] for word in cycle_status
-            }
+            # Number of words whose progress increased during this cycle
+            progress_increased = 0
 
-            # Convert the cycle status to a list of words
-            words_to_practice = list(cycle_status.keys())
+            while window:
+                # Save the initial progress for comparison later
+                initial_progress = {
+                    word: self.lesson.data[word]["progress"] for word in window
+                }
+                increased = set()
 
-            # Split the words into windows of up to CYCLE_PROMPTS
-            windows = [
-                words_to_practice[i : i + CYCLE_PROMPTS]
-                for i in range(0, len(words_to_practice), CYCLE_PROMPTS)
-            ]
-
-            # Track if every word's progress has decreased
-            cycle_progress_increased = {word: False for word in self.lesson.data}
-
-            for window in windows:
                 # Shuffle the words within the current window
                 random.shuffle(window)
 
-                # Track words that need to be re-asked (those answered incorrectly in the window)
-                remaining_words = window.copy()
-
-                # Keep prompting the words until all are answered correctly at least once in the current window
+                # Words answered incorrectly are re-queued at the back, which
+                # re-asks them in the same order as repeated passes would
+                remaining_words = deque(window)
                 while remaining_words:
-                    for word in remaining_words[
-                        :
-                    ]:  # Iterate over a copy of the remaining words
-                        prompt_status = mode_func(self.lesson.data, self.language, word)
-                        if prompt_status == -1:
-                            return  # -1 = exit code
-                        elif prompt_status == 0:  # answered correctly
-                            remaining_words.remove(word)
-
-                        # Check if the progress has decreased by 1 compared to the initial value
-                        if self.lesson.data[word]["progress"] > initial_progress[word]:
-                            cycle_progress_increased[word] = (
-                                True  # Mark as progress decreased
-                            )
-
-            # Check if all words in the cycle have had their progress decreased
-            if all(cycle_progress_increased[word] for word in self.lesson.data):
+                    word = remaining_words.popleft()
+                    prompt_status = mode_func(self.lesson.data, self.language, word)
+                    if prompt_status == -1:
+                        return  # -1 = exit code
+                    elif prompt_status != 0:  # not answered correctly
+                        remaining_words.append(word)
+
+                    if (
+                        word not in increased
+                        and self.lesson.data[word]["progress"] > initial_progress[word]
+                    ):
+                        increased.add(word)
+
+                progress_increased += len(increased)
+                window = list(islice(words, CYCLE_PROMPTS))
+
+            # Check if every word in the lesson has had its progress increased
+            if progress_increased == len(self.lesson.data):
                 print("Lesson complete!")
                 self.lesson.save_lesson()
                 break
@@ -133,11 +138,47 @@ class PracticeSession:
         answer = input(">> ").strip()
         return answer, self.lesson.data[word]["translation"]
 
+    @property
+    def distractors(self):
+        """Distractor index over the lesson translations, built on first use."""
+        if self._distractors is None:
+            self._distractors = DistractorIndex(
+                (data["translation"] for data in self.lesson.data.values()),
+                CHOICE_OPTIONS - 1,
+            )
+        return self._distractors
+
+    def prompt_translation_choice_from_target_word(self, word):
+        expected_answer = self.lesson.data[word]["translation"]
+        self.choice_options = self.distractors.choices(expected_answer)
+        print(f"{LANG_NAME_MAP[self.language]} word: {word}")
+        print("Choose the translation to English:")
+        self.print_choice_options()
+        return self.read_answer(), expected_answer
+
+    def print_choice_options(self):
+        for label, option in zip(ascii_lowercase, self.choice_options):
+            print(f"({label}) {option}")
+
+    def read_answer(self):
+        """Read an answer, resolving option letters of a multiple-choice prompt."""
+        answer = input(">> ").strip()
+        # Letters never collide with numeric answers; an option spelled like a
+        # letter is still matched as typed
+        labels = ascii_lowercase[: len(self.choice_options)]
+        if answer not in self.choice_options and len(answer) == 1:
+            label = answer.lower()
+            if label in labels:
+                answer = self.choice_options[labels.index(label)]
+        return answer
+
     def general_prompt(self, mode, word=None):
         if not word:
             print("Error: Word not provided for this mode.")
             return 1
 
+        # Only multiple-choice modes set options for the current prompt
+        self.choice_options = []
         answer, expected_answer = mode(word)
 
         while True:
@@ -153,16 +194,17 @@ class PracticeSession:
                 return -1
             elif answer in self.HELP_COMMANDS:
                 self.print_help()
-                answer = input(">> ").strip()
+                self.print_choice_options()
+                answer = self.read_answer()
             elif answer in self.HINT_COMMANDS:
                 print(f"The first letter of the word is '{expected_answer[0]}'.")
-                answer = input(">> ").strip()
+                answer = self.read_answer()
             elif answer in self.USAGE_COMMANDS:
                 self.show_usage(word)
-                answer = input(">> ").strip()
+                answer = self.read_answer()
             elif answer in self.PROGRESS_COMMANDS:
                 print(f"Current progress: {self.lesson.data[word]['progress']}")
-                answer = input(">> ").strip()
+                answer = self.read_answer()
             elif answer in self.SKIP_COMMANDS:
                 print("Skipping this word.")
                 self.lesson.data[word]["progress"] += 1
@@ -170,10 +212,11 @@ class PracticeSession:
             elif answer in self.REPEAT_COMMANDS:
                 print("Repeating the word...")
                 self.audio.play_text(word)
-                answer = input(">> ").strip()
+                answer = self.read_answer()
             elif answer in self.SHOW_COMMANDS:
                 print(f"Word: {word}")
-                answer = input(">> ").strip()
+                self.print_choice_options()
+                answer = self.read_answer()
             # elif answer in self.EDIT_COMMANDS:
             #    return self.edit_word(word)
             else:
@@ -217,7 +260,8 @@ class PracticeSession:
     - ['progress', '-progress', '-p']: Shows the current progress of the word.
     - ['skip', '-skip', 'accept', '-accept', '-s']: Skips the current word as if answered correctly.
     - ['show', '-show']: Prints the question.
-    - ['repeat', '-repeat', 'play', '-play']: Repeats the word by playing its audio."""
+    - ['repeat', '-repeat', 'play', '-play']: Repeats the word by playing its audio.
+    - ['a', 'b', 'c', ...]: Chooses an option in multiple choice mode."""
         )
 
     def show_usage(self, word):
@@ -2,12 +2,14 @@ import os
 import sys
 from constants import LANG_NAME_MAP, LESSONS_DIR, TARGET_PROGRESS
 from Lesson import Lesson
+from LessonIndex import LessonIndex
 from PracticeSession import PracticeSession
 
 
 class ProfessorKROApp:
     def __init__(self):
         self.target_progress = TARGET_PROGRESS
+        self.index = LessonIndex(LESSONS_DIR)
 
     def extract_lang(self, file_path):
         return file_path.split("_")[-1].split(".")[0]
@@ -15,6 +17,34 @@ class ProfessorKROApp:
     def extract_file_name(self, file_path):
         return file_path.split("\\")[-1].split(".")[0]
 
+    def search_lessons(self):
+        """Search words, translations and usages across all lessons."""
+        self.index.refresh()
+        print("Enter a word or phrase to search for (empty to go back):")
+        while True:
+            query = input(">> ").strip()
+            if not query:
+                break
+            results = self.index.search(query)
+            if not results:
+                print("No matches found.")
+                continue
+            # A word matching in both its word and translation is shown once
+            lines = {}
+            for file_path, word, field in results:
+                data = self.index.entry(file_path, word)
+                if field == "usage":
+                    lines[(file_path, word, field)] = (
+                        f"{self.extract_file_name(file_path)} | {word} | {data['usage']}"
+                    )
+                else:
+                    lines[(file_path, word, "word")] = (
+                        f"{self.extract_file_name(file_path)} | {word} -> {data['translation']}"
+                    )
+            for line in lines.values():
+                print(line)
+            print(f"Matches: {len(lines)}")
+
     def run(self):
         print("Welcome to the Professor KRO App!")
 
@@ -36,12 +66,16 @@ class ProfessorKROApp:
                     print(
                         f"({idx}) {self.extract_file_name(file)} (Language: {LANG_NAME_MAP[lang]})"
                     )
+                print("(s) Search all lessons")
 
                 # Handle invalid input for lesson choice
                 while True:
                     choice = input(">> ").strip()
 
-                    if choice.isdigit():
+                    if choice.lower() in {"s", "search"}:
+                        self.search_lessons()
+                        break
+                    elif choice.isdigit():
                         choice = int(choice)
                         if (
                             1 <= choice <= len(lessons)
@@ -54,6 +88,9 @@ class ProfessorKROApp:
                     else:
                         print("Invalid input! Please enter a valid number.")
 
+                if not isinstance(choice, int):
+                    continue
+
                 # Retrieve the selected lesson and language
                 selected_lesson = lessons[choice - 1]
                 lesson_file, language = selected_lesson
@@ -104,7 +141,10 @@ class ProfessorKROApp:
                                 print(
                                     f"(3) Practice translation to English from {LANG_NAME_MAP[language]}"
                                 )
-                                print("(4) Exit")
+                                print(
+                                    f"(4) Multiple choice translation to English from {LANG_NAME_MAP[language]}"
+                                )
+                                print("(5) Exit")
                                 mode = input(">> ").strip()
                                 # pygame.mixer.init()
                                 if mode == "1":
@@ -129,6 +169,13 @@ class ProfessorKROApp:
                                         )
                                     )
                                 elif mode == "4":
+                                    session.practice_lesson(
+                                        lambda lesson_data, language, word: session.general_prompt(
+                                            session.prompt_translation_choice_from_target_word,
+                                            word,
+                                        )
+                                    )
+                                elif mode == "5":
                                     lesson.save_lesson()
                                     break
                                 else:
@@ -0,0 +1,134 @@
+"""
+Benchmark of PracticeSession.practice_lesson against the previous loop.
+
+Run from the repository root:
+    python benchmarks/practice_loop.py
+"""
+
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import PracticeSession as practice_module
+from PracticeSession import PracticeSession
+
+
+class BenchmarkLesson:
+    def __init__(self, size, target_progress):
+        # Every tenth word is already learned, so cycles repeat until no words
+        # are left instead of the lesson completing after the first cycle
+        self.data = {
+            f"word{idx}": {
+                "translation": f"translation{idx}",
+                "progress": target_progress if idx % 10 == 0 else 0,
+                "usage": "",
+            }
+            for idx in range(size)
+        }
+
+    def save_lesson(self):
+        pass
+
+
+class BenchmarkSession(PracticeSession):
+    """PracticeSession without audio and with every new cycle accepted."""
+
+    def __init__(self, lesson, target_progress):
+        self.lesson = lesson
+        self.language = "en"
+        self.target_progress = target_progress
+
+    def confirm_choice(self, prompt=""):
+        return True
+
+
+def legacy_practice_lesson(session, mode_func):
+    """The practice loop as it was before the deque based rewrite."""
+    while True:
+        cycle_status = {
+            word: False
+            for word in session.lesson.data
+            if session.lesson.data[word]["progress"] < session.target_progress
+        }
+        if not cycle_status:
+            print("No words to practice")
+            break
+        initial_progress = {
+            word: session.lesson.data[word]["progress"] for word in cycle_status
+        }
+        words_to_practice = list(cycle_status.keys())
+        windows = [
+            words_to_practice[i : i + practice_module.CYCLE_PROMPTS]
+            for i in range(0, len(words_to_practice), practice_module.CYCLE_PROMPTS)
+        ]
+        cycle_progress_increased = {word: False for word in session.lesson.data}
+        for window in windows:
+            random.shuffle(window)
+            remaining_words = window.copy()
+            while remaining_words:
+                for word in remaining_words[:]:
+                    prompt_status = mode_func(
+                        session.lesson.data, session.language, word
+                    )
+                    if prompt_status == -1:
+                        return
+                    elif prompt_status == 0:
+                        remaining_words.remove(word)
+                    if session.lesson.data[word]["progress"] > initial_progress[word]:
+                        cycle_progress_increased[word] = True
+        if all(cycle_progress_increased[word] for word in session.lesson.data):
+            print("Lesson complete!")
+            session.lesson.save_lesson()
+            break
+        if not session.confirm_choice():
+            session.lesson.save_lesson()
+            break
+
+
+def make_mode_func(log):
+    """Answer correctly 70% of the time, updating progress like handle_answer."""
+    rng = random.Random(0)
+
+    def mode_func(lesson_data, language, word):
+        log.append(word)
+        if rng.random() < 0.7:
+            lesson_data[word]["progress"] += 1
+            return 0
+        if lesson_data[word]["progress"] > 0:
+            lesson_data[word]["progress"] -= 1
+        return 1
+
+    return mode_func
+
+
+def run(practice, size, target_progress):
+    random.seed(0)
+    session = BenchmarkSession(BenchmarkLesson(size, target_progress), target_progress)
+    log = []
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        practice(session, make_mode_func(log))
+    return time.perf_counter() - start, log
+
+
+def main():
+    for cycle_prompts in (4, 1000):
+        practice_module.CYCLE_PROMPTS = cycle_prompts
+        print(f"\nCYCLE_PROMPTS = {cycle_prompts}")
+        print("Words | Prompts | Legacy (s) | Current (s)")
+        for size in (1000, 10000, 50000):
+            legacy_time, legacy_log = run(legacy_practice_lesson, size, 3)
+            current_time, current_log = run(PracticeSession.practice_lesson, size, 3)
+            assert legacy_log == current_log, "prompt sequences differ"
+            print(
+                f"{size} | {len(current_log)} | {legacy_time:.3f} | {current_time:.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,3 +10,4 @@ LANG_NAME_MAP = {
 TARGET_PROGRESS = 4
 DEFAULT_PROGRESS = 2
 CYCLE_PROMPTS = 4
+CHOICE_OPTIONS = 4
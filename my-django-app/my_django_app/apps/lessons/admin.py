@@ -0,0 +1,23 @@
+from django.contrib import admin
+
+from .models import Lesson, Progress, Word
+
+
+@admin.register(Lesson)
+class LessonAdmin(admin.ModelAdmin):
+    list_display = ('name', 'language', 'path')
+    list_filter = ('language',)
+
+
+@admin.register(Word)
+class WordAdmin(admin.ModelAdmin):
+    list_display = ('word', 'translation', 'lesson')
+    list_select_related = ('lesson',)
+    search_fields = ('word', 'translation', 'usage')
+
+
+@admin.register(Progress)
+class ProgressAdmin(admin.ModelAdmin):
+    list_display = ('user', 'word', 'progress', 'updated_at')
+    list_select_related = ('user', 'word')
+    raw_id_fields = ('word',)
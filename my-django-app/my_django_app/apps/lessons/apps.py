@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+
+
+class LessonsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'my_django_app.apps.lessons'
+    label = 'lessons'
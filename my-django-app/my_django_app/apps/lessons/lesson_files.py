@@ -0,0 +1,60 @@
+import csv
+import os
+
+from django.core.management.base import CommandError
+
+
+# Kept free of Django models so that it can be run in worker processes
+def read_lesson_file(lessons_dir, file_path):
+    """
+    Parse a lesson CSV into (relative path, name, language, rows).
+
+    Rows map each word to its translation, usage and progress; progress is
+    None when the file leaves it empty. Malformed files raise CommandError.
+    """
+    relative_path = os.path.relpath(file_path, lessons_dir).replace(os.sep, '/')
+    file_name = os.path.splitext(os.path.basename(file_path))[0]
+    language = file_name.split('_')[-1]
+
+    rows = {}
+    try:
+        with open(file_path, mode='r', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            missing = {'word', 'translation'} - set(reader.fieldnames or ())
+            if missing:
+                raise CommandError(
+                    f"Error loading lesson data from {relative_path}: "
+                    f"missing column(s) {', '.join(sorted(missing))}."
+                )
+            for row in reader:
+                rows[validate_row(relative_path, reader.line_num, row)] = {
+                    'translation': row['translation'],
+                    'usage': (row.get('usage') or '').strip(),
+                    'progress': parse_progress(relative_path, reader.line_num, row),
+                }
+    except (OSError, UnicodeDecodeError, csv.Error) as e:
+        raise CommandError(f'Error loading lesson data from {relative_path}: {e}')
+    return relative_path, file_name, language, rows
+
+
+def validate_row(relative_path, line_num, row):
+    """Return the word of a row, checking that it has a word and translation."""
+    word = row['word']
+    if not word or row['translation'] is None:
+        raise CommandError(
+            f'Error loading lesson data from {relative_path}, line {line_num}: '
+            'word and translation are required.'
+        )
+    return word
+
+
+def parse_progress(relative_path, line_num, row):
+    progress = (row.get('progress') or '').strip()
+    if not progress:
+        return None
+    if not progress.isdecimal():
+        raise CommandError(
+            f'Error loading lesson data from {relative_path}, line {line_num}: '
+            f"progress must be a non-negative integer, got '{progress}'."
+        )
+    return int(progress)
@@ -0,0 +1,168 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from my_django_app.apps.lessons.lesson_files import read_lesson_file
+from my_django_app.apps.lessons.models import DEFAULT_PROGRESS, Lesson, Progress, Word
+
+
+class Command(BaseCommand):
+    help = 'Import (or re-import) every lesson CSV of the lessons directory.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--lessons-dir',
+            default=settings.LESSONS_DIR,
+            help='Directory searched recursively for lesson CSV files.',
+        )
+        parser.add_argument(
+            '--user',
+            help='Username whose progress is set from the progress column.',
+        )
+        parser.add_argument(
+            '--prune',
+            action='store_true',
+            help=(
+                'Delete lessons, with their words and progress, whose file is not '
+                'in the lessons directory.'
+            ),
+        )
+        parser.add_argument('--batch-size', type=int, default=1000)
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Number of processes parsing files in parallel.',
+        )
+
+    def handle(self, *args, **options):
+        lessons_dir = str(options['lessons_dir'])
+        batch_size = options['batch_size']
+        for option in ('batch_size', 'workers'):
+            if options[option] < 1:
+                raise CommandError(
+                    f"--{option.replace('_', '-')} must be a positive integer."
+                )
+
+        user = None
+        if options['user']:
+            try:
+                user = get_user_model().objects.get_by_natural_key(options['user'])
+            except get_user_model().DoesNotExist:
+                raise CommandError(f"User '{options['user']}' does not exist.")
+
+        file_paths = [
+            os.path.join(root, file)
+            for root, _, files in os.walk(lessons_dir)
+            for file in files
+            if file.endswith('.csv')
+        ]
+        if not file_paths:
+            raise CommandError(f'No lesson files found in {lessons_dir}.')
+
+        # Files are parsed in parallel worker processes; the database writes
+        # below run in a single transaction since SQLite allows only one writer
+        workers = min(options['workers'], len(file_paths))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Malformed files raise CommandError from the worker
+            parsed = list(
+                executor.map(partial(read_lesson_file, lessons_dir), file_paths)
+            )
+
+        with transaction.atomic():
+            Lesson.objects.bulk_create(
+                [
+                    Lesson(path=path, name=name, language=language)
+                    for path, name, language, _ in parsed
+                ],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['path'],
+                update_fields=['name', 'language'],
+            )
+            lesson_ids = dict(
+                Lesson.objects.filter(path__in=[path for path, *_ in parsed]).values_list(
+                    'path', 'id'
+                )
+            )
+
+            # Drop lessons whose file was deleted or renamed, with their words
+            # and progress. Paths are relative to --lessons-dir, so this is only
+            # done on request to keep imports of a subdirectory harmless
+            removed_lessons = 0
+            if options['prune']:
+                removed_lessons = (
+                    Lesson.objects.exclude(path__in=lesson_ids)
+                    .delete()[1]
+                    .get(Lesson._meta.label, 0)
+                )
+
+            Word.objects.bulk_create(
+                [
+                    Word(
+                        lesson_id=lesson_ids[path],
+                        word=word,
+                        translation=data['translation'],
+                        usage=data['usage'],
+                    )
+                    for path, _, _, rows in parsed
+                    for word, data in rows.items()
+                ],
+                batch_size=batch_size,
+                update_conflicts=True,
+                unique_fields=['lesson', 'word'],
+                update_fields=['translation', 'usage'],
+            )
+
+            # Drop words that were removed from their lesson file
+            removed = 0
+            for path, _, _, rows in parsed:
+                removed += (
+                    Word.objects.filter(lesson_id=lesson_ids[path])
+                    .exclude(word__in=list(rows))
+                    .delete()[1]
+                    .get(Word._meta.label, 0)
+                )
+
+            imported_progress = 0
+            if user is not None:
+                word_ids = {
+                    (lesson_id, word): word_id
+                    for word_id, lesson_id, word in Word.objects.filter(
+                        lesson_id__in=lesson_ids.values()
+                    ).values_list('id', 'lesson_id', 'word')
+                }
+                progress = [
+                    Progress(
+                        user=user,
+                        word_id=word_ids[(lesson_ids[path], word)],
+                        progress=(
+                            DEFAULT_PROGRESS
+                            if data['progress'] is None
+                            else data['progress']
+                        ),
+                    )
+                    for path, _, _, rows in parsed
+                    for word, data in rows.items()
+                ]
+                Progress.objects.bulk_create(
+                    progress,
+                    batch_size=batch_size,
+                    update_conflicts=True,
+                    unique_fields=['user', 'word'],
+                    update_fields=['progress', 'updated_at'],
+                )
+                imported_progress = len(progress)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Imported {len(parsed)} lessons ({removed_lessons} removed), '
+                f'{sum(len(rows) for *_, rows in parsed)} words '
+                f'({removed} removed), {imported_progress} progress entries.'
+            )
+        )
@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.db import models
+
+# Mirrors DEFAULT_PROGRESS of the command line app
+DEFAULT_PROGRESS = 2
+
+
+class Lesson(models.Model):
+    """A lesson CSV file from the lessons directory."""
+
+    path = models.CharField(max_length=255, unique=True)
+    name = models.CharField(max_length=255)
+    language = models.CharField(max_length=8, db_index=True)
+
+    class Meta:
+        ordering = ['path']
+
+    def __str__(self):
+        return self.name
+
+
+class Word(models.Model):
+    """A single row of a lesson."""
+
+    lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE, related_name='words')
+    word = models.CharField(max_length=255)
+    translation = models.CharField(max_length=255)
+    usage = models.TextField(blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['lesson', 'word'], name='unique_lesson_word'),
+        ]
+
+    def __str__(self):
+        return f'{self.word} -> {self.translation}'
+
+
+class ProgressQuerySet(models.QuerySet):
+    def due_for(self, user, target_progress):
+        """Progress of the words the user has not yet learned up to target_progress."""
+        return (
+            self.filter(user=user, progress__lt=target_progress)
+            .select_related('word', 'word__lesson')
+            .order_by('progress', 'word_id')
+        )
+
+
+class Progress(models.Model):
+    """Progress of a user on a word."""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='progress'
+    )
+    word = models.ForeignKey(Word, on_delete=models.CASCADE, related_name='progress')
+    progress = models.PositiveIntegerField(default=DEFAULT_PROGRESS)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ProgressQuerySet.as_manager()
+
+    class Meta:
+        verbose_name_plural = 'progress'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'word'], name='unique_user_word'),
+        ]
+        indexes = [
+            # Serves due_for: equality on user, range on progress, then word order
+            models.Index(fields=['user', 'progress', 'word'], name='progress_due_idx'),
+        ]
+
+    def __str__(self):
+        return f'{self.user} | {self.word.word} | {self.progress}'
@@ -35,6 +35,7 @@ INSTALLED_APPS = [
     'django.contrib.messages',
     'django.contrib.staticfiles',
     # Add your apps here
+    'my_django_app.apps.lessons',
 ]
 
 MIDDLEWARE = [
@@ -114,6 +115,9 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]  # Adjust as needed
 
+# Lesson CSV files shared with the command line app
+LESSONS_DIR = BASE_DIR.parent / 'lessons'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/X.X/ref/settings/#default-auto-field
 